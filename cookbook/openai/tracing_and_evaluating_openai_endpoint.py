@@ -1,8 +1,9 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import openai
 from attr import asdict
@@ -23,14 +24,22 @@ cache = InMemoryCache() if use_cache else None
 Parea(api_key=os.getenv("PAREA_API_KEY"), cache=cache)
 
 
+# constant grader prompts, built once at import time; the pinned seed makes repeated gradings
+# reproducible and lets the SDK's deterministic prompt cache serve re-runs without an LLM call
+EVAL_SEED = 42
+FRIENDLINESS_SYSTEM_MESSAGE = {"role": "system", "content": "You evaluate the friendliness of the following response on a scale of 0 to 10. You must only return a number."}
+USEFULNESS_SYSTEM_MESSAGE = {"role": "system", "content": "You evaluate the usefulness of the response given the user input on a scale of 0 to 10. You must only return a number."}
+
+
 def friendliness(log: Log) -> float:
     output = log.output
     response = call_openai(
         [
-            {"role": "system", "content": "You evaluate the friendliness of the following response on a scale of 0 to 10. You must only return a number."},
+            FRIENDLINESS_SYSTEM_MESSAGE,
             {"role": "assistant", "content": output},
         ],
         model="gpt-4",
+        seed=EVAL_SEED,
     )
     try:
         return float(response) / 10.0
@@ -43,10 +52,11 @@ def usefulness(log: Log) -> float:
     output = log.output
     response = call_openai(
         [
-            {"role": "system", "content": "You evaluate the usefulness of the response given the user input on a scale of 0 to 10. You must only return a number."},
+            USEFULNESS_SYSTEM_MESSAGE,
             {"role": "assistant", "content": f'''User input: "{user_input}"\nAssistant response: "{output}"'''},
         ],
         model="gpt-4",
+        seed=EVAL_SEED,
     )
     try:
         return float(response) / 10.0
@@ -56,26 +66,31 @@ def usefulness(log: Log) -> float:
 
 @trace(eval_funcs=[friendliness, usefulness])
 def helpful_the_second_time(messages: List[Dict[str, str]]) -> str:
-    helpful_response = call_openai(
-        [
-            {"role": "system", "content": "You are a friendly, and helpful assistant that helps people with their homework."},
-        ]
-        + messages,
-        model="gpt-4",
-    )
-
-    has_user_asked_before_raw = call_openai(
-        [
-            {
-                "role": "system",
-                "content": "Assess if the user has asked the last question before or is asking again for more \
+    # the helpful answer and the asked-before check only depend on the chat history,
+    # so both calls run concurrently; only the unhelpful rewrite below needs the answer
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        helpful_response_future = executor.submit(
+            call_openai,
+            [
+                {"role": "system", "content": "You are a friendly, and helpful assistant that helps people with their homework."},
+            ]
+            + messages,
+            model="gpt-4",
+        )
+        has_user_asked_before_future = executor.submit(
+            call_openai,
+            [
+                {
+                    "role": "system",
+                    "content": "Assess if the user has asked the last question before or is asking again for more \
 information on a previous topic. If so, respond ASKED_BEFORE. Otherwise, respond NOT_ASKED_BEFORE.",
-            }
-        ]
-        + messages,
-        model="gpt-4",
-    )
-    has_user_asked_before = has_user_asked_before_raw == "ASKED_BEFORE"
+                }
+            ]
+            + messages,
+            model="gpt-4",
+        )
+        helpful_response = helpful_response_future.result()
+        has_user_asked_before = has_user_asked_before_future.result() == "ASKED_BEFORE"
 
     if has_user_asked_before:
         messages.append({"role": "assistant", "content": helpful_response})
@@ -102,21 +117,29 @@ goal_success_ratio = goal_success_ratio_factory(use_output=True)
 
 
 @trace(eval_funcs=[goal_success_ratio], access_output_of_func=lambda x: x[0])
-def unhelpful_chat():
-    print("\nWelcome to the somewhat helpful chat! Type 'exit' to end the session.")
+def unhelpful_chat(scripted_user_turns: Optional[List[str]] = None):
+    """Runs the chat session. Interactive by default; pass scripted_user_turns to replay a list of
+    user messages without blocking on input(), e.g. to evaluate many conversations in a batch."""
+    interactive = scripted_user_turns is None
+    if interactive:
+        print("\nWelcome to the somewhat helpful chat! Type 'exit' to end the session.")
 
     trace_id = get_current_trace_id()
 
+    user_turns = None if interactive else iter(scripted_user_turns)
     messages = []
     while True:
-        user_input = input("\nYou: ")
+        user_input = input("\nYou: ") if interactive else next(user_turns, "exit")
 
         if user_input.lower() == "exit":
-            print("Goodbye!")
+            if interactive:
+                print("Goodbye!")
             break
 
         messages.append({"role": "user", "content": user_input})
-        print("Bot:", helpful_the_second_time(messages))
+        response = helpful_the_second_time(messages)
+        if interactive:
+            print("Bot:", response)
 
     return messages, trace_id
 
@@ -14,6 +14,21 @@ load_dotenv()
 logger = logging.getLogger()
 
 
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx needs the optional h2 package; fall back to HTTP/1.1 without it."""
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+# keep idle connections around well past httpx's 5s default so spaced-out log calls
+# reuse the session instead of paying a new TCP/TLS handshake each time
+_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+
 class HTTPClient:
     _instance = None
     base_url = os.getenv("PAREA_BASE_URL", "https://parea-ai-backend-us-9ac16cdbc7a7b006.onporter.run/api/parea/v1")
@@ -22,9 +37,10 @@ class HTTPClient:
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
+            http2 = _http2_available()
             cls._instance = super().__new__(cls)
-            cls._instance.sync_client = httpx.Client(base_url=cls.base_url, timeout=60 * 3.0)
-            cls._instance.async_client = httpx.AsyncClient(base_url=cls.base_url, timeout=60 * 3.0)
+            cls._instance.sync_client = httpx.Client(base_url=cls.base_url, timeout=60 * 3.0, limits=_limits, http2=http2)
+            cls._instance.async_client = httpx.AsyncClient(base_url=cls.base_url, timeout=60 * 3.0, limits=_limits, http2=http2)
         return cls._instance
 
     def set_api_key(self, api_key: str):
@@ -52,13 +68,17 @@ class HTTPClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         api_key: Optional[str] = None,
+        serialized_data: Optional[bytes] = None,
     ) -> httpx.Response:
         """
-        Makes an HTTP request to the specified endpoint.
+        Makes an HTTP request to the specified endpoint. If serialized_data is given, it is sent
+        as the pre-serialized JSON body instead of encoding data.
         """
         headers = self._get_headers(api_key=api_key)
+        if serialized_data is not None:
+            headers["Content-Type"] = "application/json"
         try:
-            response = self.sync_client.request(method, endpoint, json=data, headers=headers, params=params)
+            response = self.sync_client.request(method, endpoint, json=data, content=serialized_data, headers=headers, params=params)
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
@@ -91,13 +111,17 @@ class HTTPClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         api_key: Optional[str] = None,
+        serialized_data: Optional[bytes] = None,
     ) -> httpx.Response:
         """
-        Makes an asynchronous HTTP request to the specified endpoint.
+        Makes an asynchronous HTTP request to the specified endpoint. If serialized_data is given,
+        it is sent as the pre-serialized JSON body instead of encoding data.
         """
         headers = self._get_headers(api_key=api_key)
+        if serialized_data is not None:
+            headers["Content-Type"] = "application/json"
         try:
-            response = await self.async_client.request(method, endpoint, json=data, headers=headers, params=params)
+            response = await self.async_client.request(method, endpoint, json=data, content=serialized_data, headers=headers, params=params)
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
@@ -36,6 +36,36 @@ class Cache(ABC):
         """
         raise NotImplementedError
 
+    def get_many(self, keys: List[CacheRequest]) -> List[Optional[TraceLog]]:
+        """
+        Get several responses from the cache in one batch, e.g. for cache warm-up.
+
+        Backends with a batched primitive (e.g. Redis MGET or a pipeline) should override this
+        to avoid one round-trip per key; the default falls back to sequential lookups.
+
+        Args:
+            keys (List[CacheRequest]): The cache keys.
+
+        Returns:
+            List[Optional[TraceLog]]: The cached response per key, None where a key was not found.
+        """
+        return [self.get(key) for key in keys]
+
+    async def aget_many(self, keys: List[CacheRequest]) -> List[Optional[TraceLog]]:
+        """
+        Get several responses from the cache in one batch, e.g. for cache warm-up.
+
+        Backends with a batched primitive (e.g. Redis MGET or a pipeline) should override this
+        to avoid one round-trip per key; the default falls back to sequential lookups.
+
+        Args:
+            keys (List[CacheRequest]): The cache keys.
+
+        Returns:
+            List[Optional[TraceLog]]: The cached response per key, None where a key was not found.
+        """
+        return [await self.aget(key) for key in keys]
+
     def set(self, key: CacheRequest, value: TraceLog):
         """
         Set a normal response in the cache.
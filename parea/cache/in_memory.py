@@ -1,10 +1,7 @@
 from typing import List, Optional
 
-from attr import asdict
-
 from parea.cache.cache import Cache
 from parea.schemas.models import CacheRequest, TraceLog
-from parea.utils.universal_encoder import json_dumps
 
 
 class InMemoryCache(Cache):
@@ -13,19 +10,25 @@ class InMemoryCache(Cache):
         self.logs = []
 
     def get(self, key: CacheRequest) -> Optional[TraceLog]:
-        return self.cache.get(json_dumps(asdict(key)))
+        return self.cache.get(key.key_digest)
 
     async def aget(self, key: CacheRequest) -> Optional[TraceLog]:
         return self.get(key)
 
+    def get_many(self, keys: List[CacheRequest]) -> List[Optional[TraceLog]]:
+        return [self.cache.get(key.key_digest) for key in keys]
+
+    async def aget_many(self, keys: List[CacheRequest]) -> List[Optional[TraceLog]]:
+        return self.get_many(keys)
+
     def set(self, key: CacheRequest, value: TraceLog):
-        self.cache[json_dumps(asdict(key))] = value
+        self.cache[key.key_digest] = value
 
     async def aset(self, key: CacheRequest, value: TraceLog):
         self.set(key, value)
 
     def invalidate(self, key: CacheRequest):
-        key = json_dumps(asdict(key))
+        key = key.key_digest
         if key in self.cache:
             del self.cache[key]
 
@@ -14,7 +14,7 @@ from parea.api_client import HTTPClient
 from parea.cache.cache import Cache
 from parea.constants import PAREA_OS_ENV_EXPERIMENT_UUID
 from parea.experiment.datasets import create_test_cases, create_test_collection
-from parea.helpers import create_paginated_trace_logs_response_from_api, gen_trace_id, serialize_metadata_values, structure_trace_log_from_api, structure_trace_logs_from_api
+from parea.helpers import create_paginated_trace_logs_response_from_api, gen_trace_id, serialize_metadata_values, structure_trace_log_from_api, structure_trace_logs_from_api, unstructure_converter
 from parea.parea_logger import parea_logger
 from parea.schemas import EvaluationResult
 from parea.schemas.models import (
@@ -166,7 +166,7 @@ class Parea:
         self._client.add_integration("sglang")
 
     def _add_project_uuid_to_data(self, data) -> dict:
-        data_dict = asdict(data)
+        data_dict = unstructure_converter.unstructure(data)
         data_dict["project_uuid"] = self.project_uuid
         return data_dict
 
@@ -179,7 +179,7 @@ class Parea:
         r = self._client.request(
             "POST",
             COMPLETION_ENDPOINT,
-            data=asdict(data),
+            data=unstructure_converter.unstructure(data),
         )
         return structure(r.json(), CompletionResponse)
 
@@ -188,7 +188,7 @@ class Parea:
         r = await self._client.request_async(
             "POST",
             COMPLETION_ENDPOINT,
-            data=asdict(data),
+            data=unstructure_converter.unstructure(data),
         )
         return structure(r.json(), CompletionResponse)
 
@@ -197,7 +197,7 @@ class Parea:
         response = self._client.stream_request(
             "POST",
             f"{COMPLETION_ENDPOINT}/stream",
-            data=asdict(data),
+            data=unstructure_converter.unstructure(data),
         )
         yield from response
 
@@ -206,7 +206,7 @@ class Parea:
         response = self._client.stream_request_async(
             "POST",
             f"{COMPLETION_ENDPOINT}/stream",
-            data=asdict(data),
+            data=unstructure_converter.unstructure(data),
         )
         async for chunk in response:
             yield chunk
@@ -1 +1 @@
-from .utils import EvalFuncTuple, call_openai, get_tokens, run_evals_in_thread_and_log, run_evals_synchronous
+from .utils import EvalFuncTuple, acall_openai, call_openai, get_tokens, run_evals_in_thread_and_log, run_evals_synchronous
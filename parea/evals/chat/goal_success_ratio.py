@@ -1,10 +1,19 @@
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
-import json
+import asyncio
 
-from parea.evals.utils import call_openai
+import orjson
+
+from parea.evals.utils import acall_openai
 from parea.schemas.log import Log
 
+_SEGMENTATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "Look at the conversation and to determine if the user is still following the same goal "
+    "or if they are following a new goal. If they are following the same goal, respond "
+    "SAME_GOAL. Otherwise, respond NEW_GOAL. In any case do not answer the user request!",
+}
+
 
 def goal_success_ratio_factory(
     use_output: Optional[bool] = False, message_field: Optional[str] = None, model: Optional[str] = "gpt-4", is_azure: Optional[bool] = False
@@ -20,6 +29,10 @@ def goal_success_ratio_factory(
     2. Assess if every goal has been reached.
     3. Calculate the average number of messages sent per segment.
 
+    The segmentation decisions are independent per 2-turn window, so they are issued concurrently instead of
+    as a chain of sequential LLM calls. This reduces the latency of the evaluation from one network round-trip
+    per window to roughly a single round-trip for the whole conversation.
+
     Args:
         is_azure: Whether to use Azure as the model. Defaults to False.
         model: The model which should be used for grading.
@@ -33,10 +46,23 @@ def goal_success_ratio_factory(
     if use_output and message_field:
         raise ValueError("Only one of use_output and message_field can be set.")
 
+    async def _classify_windows(messages: List[dict]) -> List[str]:
+        """Concurrently classifies for every 2-turn window if the user still follows the same goal."""
+        return await asyncio.gather(
+            *[
+                acall_openai(
+                    [_SEGMENTATION_SYSTEM_MESSAGE] + messages[end_index - 3 : end_index],
+                    model=model,
+                    is_azure=is_azure,
+                )
+                for end_index in range(3, len(messages), 2)
+            ]
+        )
+
     def goal_success_ratio(log: Log) -> float:
         """Returns the average amount of turns the user had to converse with the AI to reach their goals."""
         if use_output:
-            output_list_dicts = json.loads(log.output)
+            output_list_dicts = orjson.loads(log.output)
             messages = [m for m in output_list_dicts]
         elif message_field:
             messages = [m for m in log.inputs[message_field]]
@@ -46,30 +72,14 @@ def goal_success_ratio_factory(
                 messages.append({"role": "assistant", "content": log.output})
 
         # need to determine where does a new goal start
+        labels = asyncio.run(_classify_windows(messages))
+
         conversation_segments = []
         start_index = 0
-        end_index = 3
-        while end_index < len(messages):
-            user_follows_same_goal = call_openai(
-                [
-                    {
-                        "role": "system",
-                        "content": "Look at the conversation and to determine if the user is still following the same goal "
-                        "or if they are following a new goal. If they are following the same goal, respond "
-                        "SAME_GOAL. Otherwise, respond NEW_GOAL. In any case do not answer the user request!",
-                    }
-                ]
-                + messages[start_index:end_index],
-                model=model,
-                is_azure=is_azure,
-            )
-
-            if user_follows_same_goal == "SAME_GOAL":
-                end_index += 2
-            else:
+        for end_index, user_follows_same_goal in zip(range(3, len(messages), 2), labels):
+            if user_follows_same_goal != "SAME_GOAL":
                 conversation_segments.append(messages[start_index : end_index - 1])
                 start_index = end_index - 1
-                end_index += 2
 
         if start_index < len(messages):
             conversation_segments.append(messages[start_index:])
@@ -1,8 +1,13 @@
 from typing import Callable, List, Optional
 
+import re
+
 from parea.evals.utils import call_openai, get_context, ndcg
 from parea.schemas.log import Log
 
+# only bare numbers: digits glued to letters (e.g. the "3" in "Passage3") are not indices
+_RERANK_NUMBER_PATTERN = re.compile(r"(?<![A-Za-z\d])\d+(?![A-Za-z])")
+
 
 def context_ranking_listwise_factory(
     question_field: str = "question",
@@ -43,11 +48,8 @@ def context_ranking_listwise_factory(
         if len(contexts) == 0 or len(contexts) == 1:
             return list(range(len(contexts)))
 
-        prompt = ""
-        for i in range(len(contexts)):
-            prompt += f"Passage{i + 1} = {contexts[i]}\n"
-
-        prompt += f"""Query = {query}
+        passages = "".join(f"Passage{i + 1} = {context}\n" for i, context in enumerate(contexts))
+        prompt = f"""{passages}Query = {query}
         Passages = [Passage1, ..., Passage{len(contexts)}]
         Sort the Passages by their relevance to the Query.
         Sorted Passages = ["""
@@ -64,12 +66,14 @@ def context_ranking_listwise_factory(
             is_azure=is_azure,
         )
 
-        s = sorted_list.strip("[] ").replace(" ", "")
-        number_strings = s.split(",")
-        return [int(num) for num in number_strings if num.isdigit()]
+        return [int(num) for num in _RERANK_NUMBER_PATTERN.findall(sorted_list)]
 
     def progressive_reranking(query: str, contexts: List[str]) -> List[int]:
-        """Returns the indices of the contexts in the order of their relevance (most relevant to least relevant)."""
+        """Returns the indices of the contexts in the order of their relevance (most relevant to least relevant).
+
+        The sweep is a dependent chain and must stay sequential: each window overlaps the previous
+        one by half, and relevant items only bubble to the front because every rerank sees the
+        output of the preceding overlapping window."""
         if len(contexts) <= n_contexts_to_rank:
             return listwise_reranking(query, contexts)
 
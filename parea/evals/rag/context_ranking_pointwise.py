@@ -1,8 +1,31 @@
 from typing import Callable, List, Optional
 
-from parea.evals.utils import call_openai, get_context, safe_json_loads
+import asyncio
+
+from parea.evals.utils import acall_openai, get_context, safe_json_loads
 from parea.schemas.log import Log
 
+# constant few-shot preamble, built once at import time instead of per verification call
+_VERIFICATION_PROMPT_TEMPLATE = """\
+Verify if the information in the given context is useful in answering the question.
+
+question: What are the health benefits of green tea?
+context:
+This article explores the rich history of tea cultivation in China, tracing its roots back to the ancient dynasties. It discusses how different regions have developed their unique tea varieties and brewing techniques. The article also delves into the cultural significance of tea in Chinese society and how it has become a symbol of hospitality and relaxation.
+verification:
+{{"reason":"The context, while informative about the history and cultural significance of tea in China, does not provide specific information about the health benefits of green tea. Thus, it is not useful for answering the question about health benefits.", "verdict":"No"}}
+
+question: How does photosynthesis work in plants?
+context:
+Photosynthesis in plants is a complex process involving multiple steps. This paper details how chlorophyll within the chloroplasts absorbs sunlight, which then drives the chemical reaction converting carbon dioxide and water into glucose and oxygen. It explains the role of light and dark reactions and how ATP and NADPH are produced during these processes.
+verification:
+{{"reason":"This context is extremely relevant and useful for answering the question. It directly addresses the mechanisms of photosynthesis, explaining the key components and processes involved.", "verdict":"Yes"}}
+
+question:{question}
+context:
+{context}
+verification:"""
+
 
 def context_ranking_pointwise_factory(
     question_field: str = "question",
@@ -10,6 +33,7 @@ def context_ranking_pointwise_factory(
     ranking_measurement="average_precision",
     model: Optional[str] = "gpt-3.5-turbo-16k",
     is_azure: Optional[bool] = False,
+    concurrency: int = 10,
 ) -> Callable[[Log], float]:
     """
     This factory creates an evaluation function that measures how well the retrieved contexts are ranked by relevancy to the given query
@@ -24,62 +48,47 @@ def context_ranking_pointwise_factory(
         question_field: The key name/field used for the question/query of the user. Defaults to "question".
         context_fields: An optional list of key names/fields used for the retrieved contexts in the input to function. If empty list or None, it will use the output field of the log as context. Defaults to None.
         ranking_measurement: Method to calculate ranking. Currently, only supports "average_precision".
+        concurrency: Maximum number of concurrent LLM verification calls. Defaults to 10.
 
     Returns:
         Callable[[Log], float]: A function that takes a log as input and returns a score between 0 and 1 indicating
         how well the retrieved context is ranked by their relevancy.
-
-    Raises:
-        ImportError: If numpy is not installed.
     """
-    try:
-        import numpy as np
-    except ImportError:
-        raise ImportError("Please install numpy to use this metric.")
 
     def context_ranking_pointwise(log: Log) -> float:
         """Quantifies if the retrieved context is ranked by their relevancy"""
         question = log.inputs[question_field]
         contexts = get_context(log, context_fields, True)
 
-        verifications = []
-        for context in contexts:
-            response = call_openai(
-                model=model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"""\
-Verify if the information in the given context is useful in answering the question.
+        async def verify_context(semaphore: asyncio.Semaphore, context: str) -> str:
+            async with semaphore:
+                return await acall_openai(
+                    model=model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": _VERIFICATION_PROMPT_TEMPLATE.format(question=question, context=context),
+                        }
+                    ],
+                    temperature=0.0,
+                    is_azure=is_azure,
+                )
 
-question: What are the health benefits of green tea?
-context:
-This article explores the rich history of tea cultivation in China, tracing its roots back to the ancient dynasties. It discusses how different regions have developed their unique tea varieties and brewing techniques. The article also delves into the cultural significance of tea in Chinese society and how it has become a symbol of hospitality and relaxation.
-verification:
-{{"reason":"The context, while informative about the history and cultural significance of tea in China, does not provide specific information about the health benefits of green tea. Thus, it is not useful for answering the question about health benefits.", "verdict":"No"}}
+        async def verify_contexts() -> List[str]:
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*[verify_context(semaphore, context) for context in contexts])
 
-question: How does photosynthesis work in plants?
-context:
-Photosynthesis in plants is a complex process involving multiple steps. This paper details how chlorophyll within the chloroplasts absorbs sunlight, which then drives the chemical reaction converting carbon dioxide and water into glucose and oxygen. It explains the role of light and dark reactions and how ATP and NADPH are produced during these processes.
-verification:
-{{"reason":"This context is extremely relevant and useful for answering the question. It directly addresses the mechanisms of photosynthesis, explaining the key components and processes involved.", "verdict":"Yes"}}
-
-question:{question}
-context:
-{context}
-verification:""",
-                    }
-                ],
-                temperature=0.0,
-                is_azure=is_azure,
-            )
-            verifications.append(response)
+        verifications = asyncio.run(verify_contexts())
 
         if ranking_measurement == "average_precision":
             response = [safe_json_loads(item) for item in verifications]
-            response = [int("yes" in resp.get("verdict", " ").lower()) if resp.get("verdict") else np.nan for resp in response]
+            response = [int("yes" in resp.get("verdict", " ").lower()) if resp.get("verdict") else float("nan") for resp in response]
             denominator = sum(response) + 1e-10
-            numerator = sum([(sum(response[: i + 1]) / (i + 1)) * response[i] for i in range(len(response))])
+            numerator = 0.0
+            hits = 0
+            for i, relevance in enumerate(response):
+                hits += relevance
+                numerator += (hits / (i + 1)) * relevance
             return numerator / denominator
         else:
             raise NotImplementedError
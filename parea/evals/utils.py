@@ -1,9 +1,16 @@
 from typing import Callable, List, Optional, Union
 
+import asyncio
+import hashlib
 import json
+import threading
 import warnings
+import weakref
+from collections import OrderedDict
 
+import httpx
 import openai
+import orjson
 import pysbd
 import tiktoken
 from attrs import define
@@ -32,15 +39,95 @@ def sent_tokenize(text: str) -> List[str]:
 
 def safe_json_loads(s) -> dict:
     try:
-        return json.loads(s)
+        return orjson.loads(s)
     except ValueError as e:
         warnings.warn(f"Invalid json: {e}")
 
     return {}
 
 
+# one client (and thus one connection pool) per event loop and provider, so concurrent
+# eval calls within a loop reuse connections instead of paying TCP/TLS setup per call
+_async_openai_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _make_async_http_client() -> Optional[httpx.AsyncClient]:
+    """Returns an HTTP/2-enabled httpx client if the optional h2 package is installed, else None
+    to let the OpenAI SDK use its default HTTP/1.1 client."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return None
+    return httpx.AsyncClient(http2=True)
+
+
+def _get_async_openai_client(is_azure: bool = False):
+    """Returns a shared AsyncOpenAI (or AsyncAzureOpenAI) client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    clients = _async_openai_clients.setdefault(loop, {})
+    provider = "azure" if is_azure else "openai"
+    if provider not in clients:
+        if is_azure:
+            from openai.lib.azure import AsyncAzureOpenAI
+
+            clients[provider] = AsyncAzureOpenAI(http_client=_make_async_http_client())
+        else:
+            clients[provider] = openai.AsyncOpenAI(http_client=_make_async_http_client())
+    return clients[provider]
+
+
+_PROMPT_CACHE_MAX_SIZE = 512
+_prompt_cache: "OrderedDict[bytes, Union[str, List[str]]]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+def _prompt_cache_key(messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed=None) -> Optional[bytes]:
+    """Builds a cache key for deterministic calls (temperature 0 or a pinned seed) from the
+    whitespace-normalized messages and the remaining sampling parameters. Returns None if the
+    call should not be cached."""
+    if temperature != 0.0 and seed is None:
+        return None
+    try:
+        normalized_messages = [[m.get("role", ""), " ".join(str(m.get("content", "")).split())] for m in messages]
+        payload = orjson.dumps([normalized_messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed])
+    except (AttributeError, TypeError):
+        return None
+    return hashlib.blake2b(payload).digest()
+
+
+def _prompt_cache_get(key: Optional[bytes]) -> Optional[Union[str, List[str]]]:
+    if key is None:
+        return None
+    with _prompt_cache_lock:
+        if key in _prompt_cache:
+            _prompt_cache.move_to_end(key)
+            return _prompt_cache[key]
+    return None
+
+
+def _prompt_cache_set(key: Optional[bytes], value: Union[str, List[str]]) -> None:
+    if key is None:
+        return
+    with _prompt_cache_lock:
+        _prompt_cache[key] = value
+        _prompt_cache.move_to_end(key)
+        while len(_prompt_cache) > _PROMPT_CACHE_MAX_SIZE:
+            _prompt_cache.popitem(last=False)
+
+
 def call_openai(
-    messages, model, temperature=1.0, max_tokens=None, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, response_format=None, n=1, is_azure=False
+    messages, model, temperature=1.0, max_tokens=None, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, response_format=None, n=1, is_azure=False, seed=None
+) -> Union[str, List[str]]:
+    cache_key = _prompt_cache_key(messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed)
+    if (cached := _prompt_cache_get(cache_key)) is not None:
+        return cached
+    response = _call_openai(messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed)
+    _prompt_cache_set(cache_key, response)
+    return response
+
+
+def _call_openai(
+    messages, model, temperature=1.0, max_tokens=None, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, response_format=None, n=1, is_azure=False, seed=None
 ) -> Union[str, List[str]]:
     openai.api_type = "openai"
     if is_azure:
@@ -58,6 +145,7 @@ def call_openai(
             presence_penalty=presence_penalty,
             response_format=response_format,
             n=n,
+            seed=seed,
         )
         if n == 1:
             return completion.choices[0].message.content
@@ -89,6 +177,75 @@ def call_openai(
             presence_penalty=presence_penalty,
             response_format=response_format,
             n=n,
+            seed=seed,
+        )
+        if n == 1:
+            return completion.choices[0].message.content
+        else:
+            return [c.message.content for c in completion.choices]
+
+
+async def acall_openai(
+    messages, model, temperature=1.0, max_tokens=None, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, response_format=None, n=1, is_azure=False, seed=None
+) -> Union[str, List[str]]:
+    cache_key = _prompt_cache_key(messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed)
+    if (cached := _prompt_cache_get(cache_key)) is not None:
+        return cached
+    response = await _acall_openai(messages, model, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_format, n, is_azure, seed)
+    _prompt_cache_set(cache_key, response)
+    return response
+
+
+async def _acall_openai(
+    messages, model, temperature=1.0, max_tokens=None, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0, response_format=None, n=1, is_azure=False, seed=None
+) -> Union[str, List[str]]:
+    openai.api_type = "openai"
+    if is_azure:
+        openai.api_type = "azure"
+
+        completion = await _get_async_openai_client(is_azure=True).chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            response_format=response_format,
+            n=n,
+            seed=seed,
+        )
+        if n == 1:
+            return completion.choices[0].message.content
+        else:
+            return [c.message.content for c in completion.choices]
+    if openai_version.startswith("0."):
+        completion = await openai.ChatCompletion.acreate(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            n=n,
+        )
+        if n == 1:
+            return completion.choices[0].message["content"]
+        else:
+            return [c.message["content"] for c in completion.choices]
+    else:
+        completion = await _get_async_openai_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            response_format=response_format,
+            n=n,
+            seed=seed,
         )
         if n == 1:
             return completion.choices[0].message.content
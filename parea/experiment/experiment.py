@@ -16,6 +16,7 @@ from parea import Parea
 from parea.constants import PAREA_OS_ENV_EXPERIMENT_UUID
 from parea.experiment.dvc import save_results_to_dvc_if_init
 from parea.helpers import duplicate_dicts, gen_random_name, is_logging_disabled
+from parea.parea_logger import parea_logger
 from parea.schemas import EvaluationResult
 from parea.schemas.models import CreateExperimentRequest, ExperimentSchema, ExperimentStatsSchema, ExperimentStatus, FinishExperimentRequestSchema
 from parea.utils.trace_utils import thread_ids_running_evals, trace_data
@@ -183,6 +184,7 @@ async def experiment(
     else:
         dataset_level_eval_results = []
 
+    parea_logger.flush_logs()  # finish_experiment computes stats server-side; all queued trace logs must land first
     experiment_stats: ExperimentStatsSchema = p.finish_experiment(experiment_uuid, FinishExperimentRequestSchema(status=status, dataset_level_stats=dataset_level_eval_results))
     stat_name_to_avg_std = calculate_avg_std_for_experiment(experiment_stats)
     if dataset_level_eval_results:
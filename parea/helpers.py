@@ -7,14 +7,28 @@ from copy import deepcopy
 from datetime import datetime, timedelta
 
 import pytz
-from attr import asdict, fields_dict
-from cattrs import GenConverter
+from attr import asdict, fields_dict, resolve_types
+from cattrs import Converter, GenConverter
+from cattrs.gen import make_dict_unstructure_fn
 
 from parea.constants import ADJECTIVES, NOUNS, TURN_OFF_PAREA_LOGGING
 from parea.schemas import EvaluationResult, LLMInputs, Message, ModelParams, Role
 from parea.schemas.models import Completion, PaginatedTraceLogsResponse, TraceLog, TraceLogAnnotationSchema, TraceLogCommentSchema, TraceLogImage, TraceLogTree, UpdateLog
 from parea.utils.universal_encoder import json_dumps
 
+# Shared converter for unstructuring outgoing payloads. The hooks for the per-call hot
+# classes are compiled once at import time, so serializing a TraceLog or Completion runs
+# generated code instead of attrs.asdict's generic recursion.
+unstructure_converter = Converter()
+# TraceLogTree must be registered before its base TraceLog: generating a hook bakes in the
+# dispatch for nested fields, and a tree's children would otherwise serialize via the
+# TraceLog hook and silently drop children_logs. resolve_types turns the "TraceLogTree"
+# forward reference into a real type first; unresolved, the field is treated as Any and
+# children pass through unserialized.
+resolve_types(TraceLogTree)
+for _hot_cls in (TraceLogTree, TraceLog, Completion, UpdateLog):
+    unstructure_converter.register_unstructure_hook(_hot_cls, make_dict_unstructure_fn(_hot_cls, unstructure_converter))
+
 
 def gen_trace_id() -> str:
     """Generate a unique trace id for each chain of requests"""
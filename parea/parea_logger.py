@@ -1,15 +1,18 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List
 
-import json
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 
-from attrs import asdict, define, field
+from attrs import define, field
 from cattrs import structure
 
 from parea.api_client import HTTPClient
 from parea.constants import PAREA_OS_ENV_EXPERIMENT_UUID
-from parea.helpers import serialize_metadata_values
+from parea.helpers import serialize_metadata_values, unstructure_converter as _converter
 from parea.schemas.log import TraceIntegrations
 from parea.schemas.models import CreateGetProjectResponseSchema, TraceLog, UpdateLog
 from parea.utils.trace_integrations.langchain_utils import _dumps_json
@@ -20,12 +23,17 @@ logger = logging.getLogger()
 LOG_ENDPOINT = "/trace_log"
 VENDOR_LOG_ENDPOINT = "/trace_log/{vendor}"
 
+NUM_LOG_WORKERS = 4
+
 
 @define
 class PareaLogger:
     _client: HTTPClient = field(init=False, default=None)
     _project_uuid: str = field(init=False, default=None)
     _project_name: str = field(init=False, default=None)
+    _log_queue: queue.Queue = field(init=False, factory=queue.Queue)
+    _log_workers: List[threading.Thread] = field(init=False, factory=list)
+    _log_worker_lock: threading.Lock = field(init=False, factory=threading.Lock)
 
     def set_client(self, client: HTTPClient) -> None:
         self._client = client
@@ -56,54 +64,93 @@ class PareaLogger:
         self._client.request(
             "PUT",
             LOG_ENDPOINT,
-            data=asdict(data),
+            data=_converter.unstructure(data),
         )
 
     def record_log(self, data: TraceLog) -> None:
+        """Enqueues the log and returns immediately; background workers serialize and post queued logs."""
+        self._ensure_log_workers()
+        self._log_queue.put(data)
+
+    def _ensure_log_workers(self) -> None:
+        """Keeps a small pool of daemon workers draining the queue so a slow or retrying request
+        doesn't back up every log behind it."""
+        if len(self._log_workers) < NUM_LOG_WORKERS or not all(worker.is_alive() for worker in self._log_workers):
+            with self._log_worker_lock:
+                self._log_workers = [worker for worker in self._log_workers if worker.is_alive()]
+                while len(self._log_workers) < NUM_LOG_WORKERS:
+                    worker = threading.Thread(target=self._process_log_queue, daemon=True)
+                    worker.start()
+                    self._log_workers.append(worker)
+
+    def _process_log_queue(self) -> None:
+        while True:
+            data = self._log_queue.get()
+            try:
+                self._post_log(data)
+            except Exception as e:
+                logger.error(f"PareaLogger: Error posting trace log: {e}")
+            finally:
+                self._log_queue.task_done()
+
+    def _post_log(self, data: TraceLog) -> None:
         data = serialize_metadata_values(data)
         data.project_uuid = self._get_project_uuid()
         self._client.request(
             "POST",
             LOG_ENDPOINT,
-            data=asdict(data),
+            data=_converter.unstructure(data),
         )
 
+    def flush_logs(self, timeout: float = 30.0) -> None:
+        """Blocks until all queued logs have been posted or the timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while self._log_queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+
     async def arecord_log(self, data: TraceLog) -> None:
         data = serialize_metadata_values(data)
         data.project_uuid = self._get_project_uuid()
         await self._client.request_async(
             "POST",
             LOG_ENDPOINT,
-            data=asdict(data),
+            data=_converter.unstructure(data),
         )
 
     def default_log(self, data: TraceLog) -> None:
-        if self._client:
-            if data.target:
-                data.target = json_dumps(data.target)
-            self.record_log(data)
-
-    def record_vendor_log(self, data: Dict[str, Any], vendor: TraceIntegrations) -> None:
+        if not self._client:
+            # nothing to deliver to: skip the target serialization and queueing outright
+            return
+        if data.target:
+            data.target = json_dumps(data.target)
+        self.record_log(data)
+
+    def _prepare_vendor_log(self, data: Dict[str, Any]) -> bytes:
+        """Enriches and serializes a vendor log payload; shared by the sync and async paths.
+
+        The experiment uuid is read from the environment per call on purpose: experiment runs
+        set and clear it at runtime.
+        """
         data["project_uuid"] = self._get_project_uuid()
         if experiment_uuid := os.getenv(PAREA_OS_ENV_EXPERIMENT_UUID, None):
             data["experiment_uuid"] = experiment_uuid
         self._client.add_integration("langchain")
+        return _dumps_json(data)  # uuid is not serializable by the default encoder
+
+    def record_vendor_log(self, data: Dict[str, Any], vendor: TraceIntegrations) -> None:
         self._client.request(
             "POST",
             VENDOR_LOG_ENDPOINT.format(vendor=vendor.value),
-            data=json.loads(_dumps_json(data)),  # uuid is not serializable
+            serialized_data=self._prepare_vendor_log(data),
         )
 
     async def arecord_vendor_log(self, data: Dict[str, Any], vendor: TraceIntegrations) -> None:
-        data["project_uuid"] = self._get_project_uuid()
-        if experiment_uuid := os.getenv(PAREA_OS_ENV_EXPERIMENT_UUID, None):
-            data["experiment_uuid"] = experiment_uuid
-        self._client.add_integration("langchain")
         await self._client.request_async(
             "POST",
             VENDOR_LOG_ENDPOINT.format(vendor=vendor.value),
-            data=json.loads(_dumps_json(data)),  # uuid is not serializable
+            serialized_data=self._prepare_vendor_log(data),
         )
 
 
 parea_logger = PareaLogger()
+atexit.register(parea_logger.flush_logs)
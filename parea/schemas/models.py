@@ -1,15 +1,20 @@
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import hashlib
 import json
+from collections import defaultdict
 from enum import Enum
+from functools import cached_property
 
+import orjson
 from attrs import define, field, validators
+from cattrs import unstructure
 
 from parea.schemas import EvaluationResult
 from parea.schemas.log import EvaluatedLog, LLMInputs
 
 
-@define
+@define(slots=True)
 class Completion:
     inference_id: Optional[str] = None
     parent_trace_id: Optional[str] = None
@@ -32,7 +37,7 @@ class Completion:
     project_uuid: str = "default"
 
 
-@define
+@define(slots=True)
 class CompletionResponse:
     inference_id: str
     content: str
@@ -50,20 +55,20 @@ class CompletionResponse:
     error: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class UseDeployedPrompt:
     deployment_id: str
     llm_inputs: Optional[Dict[str, Any]] = None
 
 
-@define
+@define(slots=True)
 class Prompt:
     raw_messages: List[Dict[str, Any]]
     messages: List[Dict[str, Any]]
     inputs: Optional[Dict[str, Any]] = None
 
 
-@define
+@define(slots=True)
 class UseDeployedPromptResponse:
     deployment_id: str
     version_number: float
@@ -76,7 +81,7 @@ class UseDeployedPromptResponse:
     model_params: Optional[Dict[str, Any]] = None
 
 
-@define
+@define(slots=True)
 class FeedbackRequest:
     score: float = field(validator=[validators.ge(0), validators.le(1)])
     trace_id: Optional[str] = None
@@ -85,20 +90,20 @@ class FeedbackRequest:
     comment: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class TraceLogImage:
     url: str
     caption: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class TraceLogCommentSchema:
     comment: str
     user_id: str
     created_at: str
 
 
-@define
+@define(slots=True)
 class TraceLogAnnotationSchema:
     created_at: str
     user_id: str
@@ -108,7 +113,7 @@ class TraceLogAnnotationSchema:
     value: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class TraceLog(EvaluatedLog):
     trace_id: Optional[str] = field(default=None, validator=validators.instance_of(str))
     parent_trace_id: Optional[str] = field(default=None, validator=validators.instance_of(str))
@@ -149,31 +154,36 @@ class TraceLog(EvaluatedLog):
     execution_order: int = 0
 
 
-@define
+@define(slots=True)
 class TraceLogTree(TraceLog):
     children_logs: Optional[List["TraceLogTree"]] = field(factory=list)
 
 
-@define
+@define(slots=True)
 class CacheRequest:
     configuration: LLMInputs = LLMInputs()
 
+    @cached_property
+    def key_digest(self) -> bytes:
+        """Canonical cache key: a stable digest of the request, computed once and memoized on the instance."""
+        return hashlib.blake2b(orjson.dumps(unstructure(self), option=orjson.OPT_SORT_KEYS)).digest()
 
-@define
+
+@define(slots=True)
 class UpdateLog:
     trace_id: str
     field_name_to_value_map: Dict[str, Any]
     root_trace_id: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class CreateExperimentRequest:
     name: str
     run_name: str
     metadata: Optional[Dict[str, str]] = None
 
 
-@define
+@define(slots=True)
 class ExperimentSchema:
     name: str
     uuid: str
@@ -181,12 +191,12 @@ class ExperimentSchema:
     metadata: Optional[Dict[str, str]] = None
 
 
-@define
+@define(slots=True)
 class EvaluationResultSchema(EvaluationResult):
     id: Optional[int] = None
 
 
-@define
+@define(slots=True)
 class TraceStatsSchema:
     trace_id: str
     latency: Optional[float] = 0.0
@@ -197,29 +207,38 @@ class TraceStatsSchema:
     scores: Optional[List[EvaluationResultSchema]] = field(factory=list)
 
 
-@define
+@define(slots=True)
 class ExperimentStatsSchema:
     parent_trace_stats: List[TraceStatsSchema] = field(factory=list)
 
     @property
     def avg_scores(self) -> Dict[str, float]:
-        accumulators = {}
-        counts = {}
+        accumulators = defaultdict(float)
+        counts = defaultdict(int)
         for trace_stat in self.parent_trace_stats:
             for score in trace_stat.scores:
-                accumulators[score.name] = accumulators.get(score.name, 0.0) + score.score
-                counts[score.name] = counts.get(score.name, 0) + 1
-        return {name: accumulators[name] / counts[name] for name in accumulators}
+                accumulators[score.name] += score.score
+                counts[score.name] += 1
+        return {name: accumulator / counts[name] for name, accumulator in accumulators.items()}
 
     def cumulative_avg_score(self) -> float:
         """Returns the average score across all evals."""
-        scores = [score.score for trace_stat in self.parent_trace_stats for score in trace_stat.scores]
-        return sum(scores) / len(scores) if scores else 0.0
+        total, count = 0.0, 0
+        for trace_stat in self.parent_trace_stats:
+            for score in trace_stat.scores:
+                total += score.score
+                count += 1
+        return total / count if count else 0.0
 
     def avg_score(self, score_name: str) -> float:
         """Returns the average score for a given eval."""
-        scores = [score.score for trace_stat in self.parent_trace_stats for score in trace_stat.scores if score.name == score_name]
-        return sum(scores) / len(scores) if scores else 0.0
+        total, count = 0.0, 0
+        for trace_stat in self.parent_trace_stats:
+            for score in trace_stat.scores:
+                if score.name == score_name:
+                    total += score.score
+                    count += 1
+        return total / count if count else 0.0
 
 
 class UpdateTraceScenario(str, Enum):
@@ -231,23 +250,23 @@ class UpdateTraceScenario(str, Enum):
     LANGCHAIN_CHILD: str = "langchain_child"
 
 
-@define
+@define(slots=True)
 class CreateGetProjectSchema:
     name: str
 
 
-@define
+@define(slots=True)
 class ProjectSchema(CreateGetProjectSchema):
     uuid: str
     created_at: str
 
 
-@define
+@define(slots=True)
 class CreateGetProjectResponseSchema(ProjectSchema):
     was_created: bool
 
 
-@define
+@define(slots=True)
 class TestCase:
     id: int
     test_case_collection_id: int
@@ -276,7 +295,7 @@ class TestCaseResult(list):
         return [{"inputs": case.inputs, "target": case.target} for case in self]
 
 
-@define
+@define(slots=True)
 class TestCaseCollection:
     id: int
     name: str
@@ -343,47 +362,45 @@ class TestCaseCollection:
         return ((test_case.inputs, test_case.target) for test_case in self.test_cases.values())
 
     def get_all_test_inputs_and_targets_dict(self) -> Iterable[Dict[str, str]]:
-        return ({**test_case.inputs, "target": test_case.target} for test_case in self.test_cases.values())
+        return (dict(test_case.inputs, target=test_case.target) for test_case in self.test_cases.values())
 
     def write_to_finetune_jsonl(self, file_path: str):
-        """Converts dataset to finetune jsonl format and writes to file_path."""
-        jsonl_rows = []
-        for inputs, target in self.get_all_test_inputs_and_targets_tuple():
-            messages = json.loads(inputs["messages"])
-            try:
-                function_call = json.loads(target)
-                if isinstance(function_call, List):
-                    function_call = function_call[0]
-                if "arguments" not in function_call:
-                    # tool use format, need to convert
-                    function_call = function_call["function"]
-                function_call["arguments"] = json.dumps(function_call["arguments"])
-                assistant_response = {
-                    "role": "assistant",
-                    "function_call": function_call,
-                }
-            except json.JSONDecodeError:
-                assistant_response = {"role": "assistant", "content": target}
-            messages.append(assistant_response)
-            converted_row = {"messages": messages}
-            if functions := inputs.get("functions", None):
-                if loaded_functions := json.loads(functions):
-                    converted_row["functions"] = loaded_functions
-            jsonl_rows.append(converted_row)
-
-        data = [json.dumps(line) for line in jsonl_rows]
+        """Converts dataset to finetune jsonl format and streams it to file_path row by row."""
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(data))
-
-
-@define
+            for i, (inputs, target) in enumerate(self.get_all_test_inputs_and_targets_tuple()):
+                messages = json.loads(inputs["messages"])
+                try:
+                    function_call = json.loads(target)
+                    if isinstance(function_call, List):
+                        function_call = function_call[0]
+                    if "arguments" not in function_call:
+                        # tool use format, need to convert
+                        function_call = function_call["function"]
+                    function_call["arguments"] = json.dumps(function_call["arguments"])
+                    assistant_response = {
+                        "role": "assistant",
+                        "function_call": function_call,
+                    }
+                except json.JSONDecodeError:
+                    assistant_response = {"role": "assistant", "content": target}
+                messages.append(assistant_response)
+                converted_row = {"messages": messages}
+                if functions := inputs.get("functions", None):
+                    if loaded_functions := json.loads(functions):
+                        converted_row["functions"] = loaded_functions
+                if i > 0:
+                    f.write("\n")
+                f.write(json.dumps(converted_row))
+
+
+@define(slots=True)
 class CreateTestCase:
     inputs: Dict[str, str]
     target: Optional[str] = None
     tags: List[str] = field(factory=list)
 
 
-@define
+@define(slots=True)
 class CreateTestCases:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -395,13 +412,13 @@ class CreateTestCases:
             raise ValueError("One of id or name must be set.")
 
 
-@define
+@define(slots=True)
 class CreateTestCaseCollection(CreateTestCases):
     # column names excluding reserved names, target and tags
     column_names: List[str] = field(factory=list)
 
 
-@define
+@define(slots=True)
 class UpdateTestCase:
     inputs: Optional[Dict[str, Any]] = None
     target: Optional[Union[int, float, str, bool]] = None
@@ -415,13 +432,13 @@ class ExperimentStatus(str, Enum):
     FAILED = "failed"
 
 
-@define
+@define(slots=True)
 class FinishExperimentRequestSchema:
     status: ExperimentStatus
     dataset_level_stats: Optional[List[EvaluationResult]] = field(factory=list)
 
 
-@define
+@define(slots=True)
 class ListExperimentUUIDsFilters:
     project_name: Optional[str] = None
     metadata_filter: Optional[Dict[str, Any]] = None
@@ -445,7 +462,7 @@ class StatisticOperation(str, Enum):
     CUSTOM = "custom"
 
 
-@define
+@define(slots=True)
 class ExperimentPinnedStatistic:
     var1: str
     operation: StatisticOperation
@@ -453,7 +470,7 @@ class ExperimentPinnedStatistic:
     var2: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class ExperimentWithPinnedStatsSchema:
     name: str
     uuid: str
@@ -480,7 +497,7 @@ class FilterOperator(str, Enum):
     IN = "in"
 
 
-@define
+@define(slots=True)
 class TraceLogFilters:
     filter_field: Optional[str] = None
     filter_key: Optional[str] = None
@@ -501,7 +518,7 @@ class TimeRange(str, Enum):
     LAST_12_MONTHS = "1y"
 
 
-@define
+@define(slots=True)
 class QueryParams:
     project_name: str
     filter_field: Optional[str] = None
@@ -514,7 +531,7 @@ class QueryParams:
     status: Optional[str] = None
 
 
-@define
+@define(slots=True)
 class PaginatedTraceLogsResponse:
     total: int
     page: int